@@ -24,7 +24,6 @@ __all__ = ["BendModeToForce"]
 import numpy as np
 
 from .ofc_data import OFCData
-from .utils import rot_1d_array
 
 
 class BendModeToForce:
@@ -37,6 +36,11 @@ class BendModeToForce:
         Name of the component. Must be in the `ofc_data.bend_mode` dictionary.
     ofc_data : `OFCData`
         Data container class.
+    dtype : `type`, optional
+        Floating point type used to store the influence matrix and compute
+        forces and bending modes. Use `numpy.float32` to halve the memory
+        traffic when single precision is accurate enough (default:
+        `numpy.float64`).
 
     Attributes
     ----------
@@ -44,6 +48,8 @@ class BendModeToForce:
         Name of the component in the `ofc_data.bend_mode` dictionary.
     ofc_data : `OFCData`
         OFC data container class.
+    dtype : `type`
+        Floating point type of the influence matrix and of the results.
     RCOND : `float`
         Cutoff for small singular values, used when computing pseudo-inverse
         matrix.
@@ -52,7 +58,9 @@ class BendModeToForce:
     bending_mode_stresses_negative : `np.ndarray[float]`
         Bending mode stresses in psi/um for compressive stress.
     rot_mat : `np.ndarray[float]`
-        Influence matrix relating bending mode to actuator force.
+        Influence matrix relating bending mode to actuator force. Setting
+        this attribute also updates the cached pseudo-inverse used by
+        `bending_mode`.
 
     Raises
     ------
@@ -65,9 +73,13 @@ class BendModeToForce:
 
     RCOND = 1e-4
 
-    def __init__(self, component: str, ofc_data: OFCData) -> None:
+    def __init__(
+        self, component: str, ofc_data: OFCData, dtype: type = np.float64
+    ) -> None:
         self.component = component
 
+        self.dtype = dtype
+
         self.ofc_data = ofc_data
 
         if component not in self.ofc_data.bend_mode:
@@ -106,12 +118,40 @@ class BendModeToForce:
         # forces
         # The first three terms (actuator ID in ZEMAX, x position in m,
         # y position in m) are not needed.
-        usecols = np.arange(3, 3 + n_bending_modes)
-
-        self.rot_mat = np.array(self.ofc_data.bend_mode[component]["force"]["data"])[
-            :, usecols
+        self.rot_mat = np.asarray(self.ofc_data.bend_mode[component]["force"]["data"])[
+            :, 3 : 3 + n_bending_modes
         ]
 
+    @property
+    def rot_mat(self) -> np.ndarray[float]:
+        """Influence matrix relating bending mode to actuator force
+        (read-only).
+        """
+        return self._rot_mat
+
+    @rot_mat.setter
+    def rot_mat(self, value: np.ndarray[float]) -> None:
+        """Set the influence matrix and update its pseudo-inverse.
+
+        The pseudo-inverse only depends on the influence matrix, so it is
+        computed once here instead of on every call to `bending_mode`.
+
+        Parameters
+        ----------
+        value : `np.ndarray[float]`
+            Influence matrix relating bending mode to actuator force.
+        """
+        # Keep a read-only copy, so the matrix can only change through this
+        # setter and values derived from it can be cached safely.
+        self._rot_mat = np.array(value, dtype=self.dtype, order="C")
+        self._rot_mat.flags.writeable = False
+        # The pseudo-inverse is always computed in double precision and only
+        # then converted to the requested type.
+        self._pinv_rot_mat = np.ascontiguousarray(
+            np.linalg.pinv(np.asarray(value, dtype=float), rcond=self.RCOND),
+            dtype=self.dtype,
+        )
+
     def get_stresses_from_dof(self, dof: np.ndarray[float]) -> np.ndarray[float]:
         """Calculated mirror stress in psi per bending mode of the mirror.
 
@@ -143,15 +183,17 @@ class BendModeToForce:
         Parameters
         ----------
         dof : `numpy.ndarray`
-            Mirror DOF in um.
+            Mirror DOF in um. Either a single DOF vector or a 2-D array with
+            one DOF vector per row.
 
         Returns
         -------
         `numpy.ndarray`
-            Actuator forces in N.
+            Actuator forces in N, with the same number of dimensions as
+            `dof`.
         """
 
-        return rot_1d_array(dof, self.rot_mat)
+        return np.asarray(dof, dtype=self.dtype) @ self.rot_mat.T
 
     def bending_mode(self, force: np.ndarray[float]) -> np.ndarray[float]:
         """Compute the bending mode.
@@ -159,14 +201,14 @@ class BendModeToForce:
         Parameters
         ----------
         force : `numpy.ndarray`
-            Actuator forces in N.
+            Actuator forces in N. Either a single force vector or a 2-D array
+            with one force vector per row.
 
         Returns
         -------
         `numpy.ndarray`
-            Estimated bending mode in um.
+            Estimated bending mode in um, with the same number of dimensions
+            as `force`.
         """
 
-        pinv_rot_mat = np.linalg.pinv(self.rot_mat, rcond=self.RCOND)
-
-        return rot_1d_array(force, pinv_rot_mat)
+        return np.asarray(force, dtype=self.dtype) @ self._pinv_rot_mat.T
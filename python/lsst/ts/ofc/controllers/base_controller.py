@@ -330,12 +330,13 @@ class BaseController:
         # Normalized image quality weight
         imqw = [self.ofc_data.image_quality_weights[sensor] for sensor in sensor_names]
 
-        if np.sum(imqw) == 0:
+        imqw_sum = sum(imqw)
+        if imqw_sum == 0:
             raise ValueError(
                 "Image quality weights sum is zero. Please check your weights."
             )
 
-        n_imqw = imqw / np.sum(imqw)
+        n_imqw = np.array(imqw) / imqw_sum
 
         fwhm = self.ETA * self.FWHM_ATM * np.sqrt(1.0 / np.array(pssn) - 1.0)
         fwhm_gq = np.sum(n_imqw * fwhm)
@@ -389,7 +390,9 @@ class BaseController:
             )
 
         self.pssn_data["sensor_names"] = sensor_names.copy()
-        self.pssn_data["pssn"] = np.zeros(len(fwhm))
 
-        for s_id, fw in enumerate(fwhm):
-            self.pssn_data["pssn"][s_id] = np.average(self.fwhm_to_pssn(fwhm))
+        # The average PSSN does not depend on the sensor, so compute it once
+        # instead of once per sensor.
+        self.pssn_data["pssn"] = np.full(
+            len(fwhm), np.average(self.fwhm_to_pssn(np.asarray(fwhm)))
+        )
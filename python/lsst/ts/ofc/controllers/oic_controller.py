@@ -25,18 +25,41 @@ import logging
 import typing
 
 import numpy as np
+import scipy.linalg
 
 from .. import BendModeToForce, OFCData, SensitivityMatrix
 from . import BaseController
 
 
 class OICController(BaseController):
-    """Optimal Integral Controller (OIC)"""
-
-    def __init__(self, ofc_data: OFCData, log: logging.Logger | None = None) -> None:
+    """Optimal Integral Controller (OIC)
+
+    Parameters
+    ----------
+    ofc_data : `OFCData`
+        OFC data container class.
+    log : `logging.Logger` or `None`, optional
+        Optional logging class to be used for logging operations. If `None`,
+        creates a new logger.
+    dtype : `type`, optional
+        Floating point type used to compute the F matrix of the control law.
+        Use `numpy.float32` to halve the memory traffic when single precision
+        is accurate enough. The F matrix gets ill-conditioned for small
+        motion penalties, in which case double precision is needed (default:
+        `numpy.float64`).
+    """
+
+    def __init__(
+        self,
+        ofc_data: OFCData,
+        log: logging.Logger | None = None,
+        dtype: type = np.float64,
+    ) -> None:
         # Initialize base class
         super().__init__(ofc_data, log)
 
+        self.dtype = dtype
+
         # Constuct the double zernike sensitivity matrix
         self.dz_sensitivity_matrix = SensitivityMatrix(self.ofc_data)
 
@@ -46,6 +69,43 @@ class OICController(BaseController):
         self.m1m3_bmf = BendModeToForce("M1M3", self.ofc_data)
         self.m2_bmf = BendModeToForce("M2", self.ofc_data)
 
+        # Standard deviation of the M1M3 and M2 influence matrices, and the
+        # matrices it was computed from, only compared by identity.
+        self._authority_m1m3_rot_mat: object = None
+        self._authority_m2_rot_mat: object = None
+        self._m1m3_authority = np.empty(0)
+        self._m2_authority = np.empty(0)
+
+        # Last evaluated sensitivity matrix, only compared by identity, the
+        # zernike and dof indices used to select from it, and the resulting
+        # selection.
+        self._selection_sensitivity_matrix: object = None
+        self._selection_key: tuple[bytes, bytes] | None = None
+        self._selected_sensitivity_matrix = np.empty((0, 0, 0))
+
+        # Gaussian quadrature weights, field angles and y2 correction, and
+        # the read-only OFCData mappings they were gathered from, only
+        # compared by identity.
+        self._gq_points: object = None
+        self._gq_weights: object = None
+        self._gq_y2_correction: object = None
+        self._gaussian_quadrature_data: tuple[list[float], list, np.ndarray] = (
+            [],
+            [],
+            np.empty((0, 0)),
+        )
+
+        # Last F matrix, the selected sensitivity matrix it was computed
+        # from, only compared by identity, and the other inputs.
+        self._mat_f_sensitivity_matrix: object = None
+        self._mat_f_key: tuple | None = None
+        self._mat_f = np.empty((0, 0))
+
+        # Methods used to compute uk for each reference strategy (xref)
+        self._calc_uk = {
+            xref: getattr(self, f"calc_uk_{xref}") for xref in self.ofc_data.xref_list
+        }
+
     def authority(self) -> np.ndarray[float]:
         """Compute the authority of the system.
 
@@ -56,22 +116,226 @@ class OICController(BaseController):
         # Rigid Body Stroke - Authority
         rbs_authority = self.ofc_data.rb_stroke[0] / self.ofc_data.rb_stroke
 
-        m1m3_authority = np.std(self.m1m3_bmf.rot_mat, axis=0)
+        # The bending mode authority only changes when the influence matrices
+        # are replaced, so reuse it until then.
+        m1m3_rot_mat = self.m1m3_bmf.rot_mat
+        m2_rot_mat = self.m2_bmf.rot_mat
 
-        m2_authority = np.std(self.m2_bmf.rot_mat, axis=0)
+        if (
+            self._authority_m1m3_rot_mat is not m1m3_rot_mat
+            or self._authority_m2_rot_mat is not m2_rot_mat
+        ):
+            self._authority_m1m3_rot_mat = m1m3_rot_mat
+            self._authority_m2_rot_mat = m2_rot_mat
+            self._m1m3_authority = np.std(m1m3_rot_mat, axis=0)
+            self._m2_authority = np.std(m2_rot_mat, axis=0)
 
         authority = np.concatenate(
             (
                 rbs_authority,
-                self.ofc_data.m1m3_actuator_penalty * m1m3_authority,
-                self.ofc_data.m2_actuator_penalty * m2_authority,
+                self.ofc_data.m1m3_actuator_penalty * self._m1m3_authority,
+                self.ofc_data.m2_actuator_penalty * self._m2_authority,
             )
         )
 
         return authority
 
+    def _select_sensitivity_matrix(
+        self, sensitivity_matrix: np.ndarray[float]
+    ) -> np.ndarray[float]:
+        """Select the sensitivity matrix at the used zernikes and degrees of
+        freedom.
+
+        The selection is cached and reused for as long as the same evaluated
+        sensitivity matrix (see `SensitivityMatrix.evaluate`) and the same
+        zernike and degree of freedom indices are used.
+
+        Parameters
+        ----------
+        sensitivity_matrix : `np.ndarray[float]`
+            Sensitivity matrix evaluated at the field angles, with shape
+            (#field angles, #zernikes, #dofs).
+
+        Returns
+        -------
+        `np.ndarray[float]`
+            Sensitivity matrix at the used zernikes and degrees of freedom
+            (read-only).
+        """
+        zn_idx = self.ofc_data.zn_idx
+        dof_idx = self.ofc_data.dof_idx
+        key = (zn_idx.tobytes(), dof_idx.tobytes())
+
+        if (
+            self._selection_sensitivity_matrix is not sensitivity_matrix
+            or self._selection_key != key
+        ):
+            # Select both axes with a single gather, which is faster than
+            # indexing one axis at a time.
+            selected_sensitivity_matrix = sensitivity_matrix[
+                :, zn_idx[:, np.newaxis], dof_idx
+            ]
+            selected_sensitivity_matrix.flags.writeable = False
+
+            self._selection_sensitivity_matrix = sensitivity_matrix
+            self._selection_key = key
+            self._selected_sensitivity_matrix = selected_sensitivity_matrix
+
+        return self._selected_sensitivity_matrix
+
+    def _get_gaussian_quadrature_data(
+        self,
+        gq_points: typing.Mapping,
+        gq_weights: typing.Mapping,
+        gq_y2_correction: typing.Mapping,
+    ) -> tuple[list[float], list, np.ndarray]:
+        """Gather the Gaussian quadrature image quality weights, field angles
+        and y2 correction.
+
+        The Gaussian quadrature data of `OFCData` is read-only, so it can
+        only change by being set again. The gathered values are cached and
+        only gathered again when that happens.
+
+        Parameters
+        ----------
+        gq_points : `typing.Mapping`
+            Gaussian quadrature points.
+        gq_weights : `typing.Mapping`
+            Image quality weights of the Gaussian quadrature points.
+        gq_y2_correction : `typing.Mapping`
+            y2 correction at the Gaussian quadrature points.
+
+        Returns
+        -------
+        imqw : `list` [`float`]
+            Image quality weights of the Gaussian quadrature points.
+        field_angles : `list`
+            Field angles of the Gaussian quadrature points.
+        y2c : `np.ndarray`
+            Read-only y2 correction at the Gaussian quadrature points, with
+            shape (#points, #zernikes).
+        """
+        if (
+            self._gq_points is not gq_points
+            or self._gq_weights is not gq_weights
+            or self._gq_y2_correction is not gq_y2_correction
+        ):
+            points = range(len(gq_weights))
+            imqw = [gq_weights[point] for point in points]
+            field_angles = [gq_points[point] for point in points]
+            y2c = np.array([gq_y2_correction[point] for point in points], dtype=float)
+            y2c.flags.writeable = False
+
+            self._gq_points = gq_points
+            self._gq_weights = gq_weights
+            self._gq_y2_correction = gq_y2_correction
+            self._gaussian_quadrature_data = (imqw, field_angles, y2c)
+
+        return self._gaussian_quadrature_data
+
+    def _calc_mat_f(
+        self,
+        sensitivity_matrix: np.ndarray[float],
+        n_imqw: np.ndarray[float],
+        cc_diag: np.ndarray[float],
+        h_diag: np.ndarray[float],
+    ) -> np.ndarray[float]:
+        """Calculate the F matrix.
+
+        F = inv(A.T * C.T * C * A + rho**2 * H).
+
+        The F matrix does not depend on the optical state, so it is cached
+        and only recomputed when any of its inputs change.
+
+        Parameters
+        ----------
+        sensitivity_matrix : `np.ndarray[float]`
+            Sensitivity matrix (A) at the used zernikes and degrees of
+            freedom, with shape (#field angles, #zernikes, #dofs).
+        n_imqw : `np.ndarray[float]`
+            Normalized image quality weights for each field angle.
+        cc_diag : `np.ndarray[float]`
+            Diagonal of the C.T * C matrix.
+        h_diag : `np.ndarray[float]`
+            Diagonal of the H matrix.
+
+        Returns
+        -------
+        `np.ndarray[float]`
+            Matrix F (read-only).
+        """
+        key = (
+            n_imqw.tobytes(),
+            cc_diag.tobytes(),
+            h_diag.tobytes(),
+            self.ofc_data.motion_penalty,
+        )
+
+        if (
+            self._mat_f_sensitivity_matrix is not sensitivity_matrix
+            or self._mat_f_key != key
+        ):
+            # Accumulate Q = sum(w * A.T * C.T * C * A) over all field angles
+            # at once, contracting the field and zernike axes in a single
+            # product.
+            _sensitivity_matrix = sensitivity_matrix.astype(self.dtype, copy=False)
+            weighted_sensitivity_matrix = (
+                np.outer(n_imqw, cc_diag).astype(self.dtype)[..., np.newaxis]
+                * _sensitivity_matrix
+            )
+            q_mat = np.tensordot(
+                _sensitivity_matrix,
+                weighted_sensitivity_matrix,
+                axes=([0, 1], [0, 1]),
+            )
+
+            # H is diagonal, add it to the diagonal of Q in place
+            mat_f_inv = q_mat
+            mat_f_inv[np.diag_indices_from(mat_f_inv)] += (
+                self.ofc_data.motion_penalty**2 * h_diag
+            ).astype(self.dtype)
+
+            # rho**2 * H + Q is symmetric positive definite, so invert it
+            # through its Cholesky factorization, which takes about half the
+            # work of the LU based inverse. Fall back to the general inverse
+            # if the matrix is not numerically positive definite.
+            try:
+                mat_f = scipy.linalg.cho_solve(
+                    scipy.linalg.cho_factor(mat_f_inv),
+                    np.eye(len(mat_f_inv), dtype=self.dtype),
+                )
+            except np.linalg.LinAlgError:
+                mat_f = np.linalg.inv(mat_f_inv)
+            mat_f.flags.writeable = False
+
+            self._mat_f_sensitivity_matrix = sensitivity_matrix
+            self._mat_f_key = key
+            self._mat_f = mat_f
+
+        return self._mat_f
+
+    @staticmethod
+    def _check_h_diag(h_diag: np.ndarray[float]) -> None:
+        """Check that the H matrix is given by its diagonal.
+
+        Parameters
+        ----------
+        h_diag : `numpy.ndarray`
+            Diagonal of the H matrix.
+
+        Raises
+        ------
+        ValueError
+            If `h_diag` is not a 1D array.
+        """
+        if np.ndim(h_diag) != 1:
+            raise ValueError(
+                "h_diag must be the diagonal of the H matrix as a 1D array, "
+                f"got an array with shape {np.shape(h_diag)}."
+            )
+
     def calc_uk_x00(
-        self, mat_f: np.ndarray[float], qx: np.ndarray[float], mat_h: np.ndarray[float]
+        self, mat_f: np.ndarray[float], qx: np.ndarray[float], h_diag: np.ndarray[float]
     ) -> np.ndarray[float]:
         """Calculate uk by referencing to "x00".
         The offset will only trace the relative changes of offset without
@@ -84,21 +348,27 @@ class OICController(BaseController):
             Matrix F.
         qx : `numpy.ndarray`
             qx array.
-        mat_h : `numpy.ndarray`
-            Matrix H.
+        h_diag : `numpy.ndarray`
+            Diagonal of the H matrix, as a 1D array.
 
         Returns
         -------
         `numpy.ndarray`
             Calculated uk in the basis of degree of freedom (DOF).
+
+        Raises
+        ------
+        ValueError
+            If `h_diag` is not a 1D array.
         """
+        self._check_h_diag(h_diag)
+
         state_diff = (
             self.dof_state[self.ofc_data.dof_idx]
             - self.dof_state0[self.ofc_data.dof_idx]
         )
-        state_diff = state_diff.reshape(-1, 1)
 
-        _qx = qx + self.ofc_data.motion_penalty**2 * mat_h.dot(state_diff)
+        _qx = qx + self.ofc_data.motion_penalty**2 * h_diag * state_diff
 
         return self.calc_uk_x0(mat_f=mat_f, qx=_qx)
 
@@ -129,10 +399,10 @@ class OICController(BaseController):
         uk : `numpy.ndarray`
             Calculated uk in the basis of degree of freedom (DOF).
         """
-        return mat_f.dot(qx)
+        return mat_f @ qx
 
     def calc_uk_0(
-        self, mat_f: np.ndarray[float], qx: np.ndarray[float], mat_h: np.ndarray[float]
+        self, mat_f: np.ndarray[float], qx: np.ndarray[float], h_diag: np.ndarray[float]
     ) -> np.ndarray[float]:
         """Calculate uk by referencing to "0".
 
@@ -146,17 +416,22 @@ class OICController(BaseController):
             Matrix F.
         qx : `numpy.ndarray`
             qx array.
-        mat_h : `numpy.ndarray`
-            The H matrix (see equation above).
+        h_diag : `numpy.ndarray`
+            Diagonal of the H matrix (see equation above), as a 1D array.
 
         Returns
         -------
         uk : `numpy.ndarray`
             Calculated uk in the basis of degree of freedom (DOF).
+
+        Raises
+        ------
+        ValueError
+            If `h_diag` is not a 1D array.
         """
-        state = self.dof_state.reshape(-1, 1)
+        self._check_h_diag(h_diag)
 
-        _qx = qx + self.ofc_data.motion_penalty**2 * mat_h.dot(state)
+        _qx = qx + self.ofc_data.motion_penalty**2 * h_diag * self.dof_state
 
         return self.calc_uk_x0(mat_f=mat_f, qx=_qx)
 
@@ -218,16 +493,15 @@ class OICController(BaseController):
         # p = C * y = C * (A * x)
         # p.T * p = (C * A * x).T * C * A * x
         #         = x.T * (A.T * C.T * C * A) * x = x.T * Q * x
-        # CCmat is C.T *C above.
+        # CCmat is C.T *C above. It is diagonal, so only its diagonal is kept
+        # and applied as a scaling of the zernike axis.
 
-        cc_mat = np.diag(self.ofc_data.alpha[self.ofc_data.zn_idx])
+        cc_diag = self.ofc_data.alpha[self.ofc_data.zn_idx]
 
         # Calculate the Qx.
         #
         # Qx = sum_{wi * A.T * C.T * C * (A * yk + y2k)}.
 
-        _dof_state = dof_state.reshape(-1, 1)
-
         # Evaluate sensitivity matrix at sensor positions
         # If the instrument is LSST, we will use the Gaussian
         # Quadrature points to evaluate the sensitivity matrix.
@@ -239,25 +513,17 @@ class OICController(BaseController):
         # Otherwise, for full array mode instruments,
         # we will use the sensor positions to retrieve the y2 correction.
         if self.ofc_data.name == "lsst":
-            if (
-                self.ofc_data.gq_points is None
-                or self.ofc_data.gq_weights is None
-                or self.ofc_data.gq_y2_correction is None
-            ):
+            gq_points = self.ofc_data.gq_points
+            gq_weights = self.ofc_data.gq_weights
+            gq_y2_correction = self.ofc_data.gq_y2_correction
+
+            if gq_points is None or gq_weights is None or gq_y2_correction is None:
                 raise RuntimeError(
                     "gq_points and gq_weights must be provided for LSST instrument."
                 )
 
-            imqw = [
-                self.ofc_data.gq_weights[sensor]
-                for sensor in range(len(self.ofc_data.gq_weights))
-            ]
-            field_angles = [
-                self.ofc_data.gq_points[sensor]
-                for sensor in range(len(self.ofc_data.gq_weights))
-            ]
-            y2c = np.array(
-                [self.ofc_data.gq_y2_correction[idx] for idx in range(len(imqw))]
+            imqw, field_angles, y2c = self._get_gaussian_quadrature_data(
+                gq_points, gq_weights, gq_y2_correction
             )
         else:
             if sensor_names is None:
@@ -276,46 +542,38 @@ class OICController(BaseController):
             )
 
         # Compute normalized image quality weights
-        if np.sum(imqw) == 0:
+        imqw_sum = sum(imqw)
+        if imqw_sum == 0:
             raise ValueError(
                 "Image quality weights sum is zero. Please check your weights."
             )
 
-        n_imqw = imqw / np.sum(imqw)
+        n_imqw = np.array(imqw) / imqw_sum
 
         # Evaluate sensitivity matrix at sensor positions
         sensitivity_matrix = self.dz_sensitivity_matrix.evaluate(field_angles)
 
-        # Select sensitivity matrix only at used degrees of freedom
-        sensitivity_matrix = sensitivity_matrix[:, self.ofc_data.zn_idx, :]
-
-        # Select sensitivity matrix only at used degrees of freedom
-        sensitivity_matrix = sensitivity_matrix[..., self.ofc_data.dof_idx]
+        # Select sensitivity matrix only at used zernikes and degrees of
+        # freedom
+        sensitivity_matrix = self._select_sensitivity_matrix(sensitivity_matrix)
 
-        qx = 0
-        q_mat = 0
-        for sen_mat, wgt, y2k in zip(sensitivity_matrix, n_imqw, y2c):
-            y2k = y2k.reshape(-1, 1)
-            qx += wgt * sen_mat.T.dot(cc_mat).dot(
-                sen_mat.dot(_dof_state) + y2k[self.ofc_data.zn_idx]
-            )
-            q_mat += wgt * sen_mat.T.dot(cc_mat).dot(sen_mat)
-
-        # Calculate the F matrix.
-        #
-        # F = inv(A.T * C.T * C * A + rho * H).
+        # Accumulate the Qx sum over all field angles at once, contracting
+        # the field and zernike axes in a single product.
+        weighted_residual = np.outer(n_imqw, cc_diag) * (
+            sensitivity_matrix @ dof_state + y2c[:, self.ofc_data.zn_idx]
+        )
+        qx = np.tensordot(sensitivity_matrix, weighted_residual, axes=([0, 1], [0, 1]))
 
         authority = self.authority()
         dof_idx = self.ofc_data.dof_idx
-        mat_h = np.diag(authority[dof_idx] ** 2)
+        # H is diagonal, only keep its diagonal
+        h_diag = authority[dof_idx] ** 2
 
-        mat_f = np.linalg.inv(self.ofc_data.motion_penalty**2 * mat_h + q_mat)
+        mat_f = self._calc_mat_f(sensitivity_matrix, n_imqw, cc_diag, h_diag)
 
-        uk = getattr(self, f"calc_uk_{self.ofc_data.xref}")(
-            mat_f=mat_f, qx=qx, mat_h=mat_h
-        )
+        uk = self._calc_uk[self.ofc_data.xref](mat_f=mat_f, qx=qx, h_diag=h_diag)
 
-        return uk.ravel()
+        return uk
 
     def control_step(
         self,
@@ -70,7 +70,9 @@ class Correction:
     }
 
     def __init__(self, *args: object) -> None:
-        self.correction = np.copy(np.array(args, dtype=float).flatten())
+        # np.array always copies the input sequence, so the correction owns
+        # its data and ravel returns a view of it.
+        self.correction = np.array(args, dtype=float).ravel()
 
         if len(self.correction) in self.size_to_correction_type:
             self.correction_type = self.size_to_correction_type[len(self.correction)]
@@ -99,6 +99,15 @@ class OFC:
 
         self.dof_order = ("m2HexPos", "camHexPos", "M1M3Bend", "M2Bend")
 
+        # Pseudo-inverse of the component rotation matrices, keyed by
+        # component name. See `_get_inv_rot_mat`.
+        self._inv_rot_mat_cache: dict = dict()
+
+        # Bending mode to force converters, keyed by component name. Building
+        # one reads the whole actuator influence matrix, so they are created
+        # once when first needed.
+        self._bmf: dict[str, BendModeToForce] = dict()
+
     def calculate_corrections(
         self,
         wfe: np.ndarray[float],
@@ -196,27 +205,61 @@ class OFC:
 
         start_idx = self.ofc_data.comp_dof_idx[dof_comp]["startIdx"]
         end_idx = start_idx + self.ofc_data.comp_dof_idx[dof_comp]["idxLength"]
-        dof_idx = np.arange(start_idx, end_idx)
 
-        dof = self.controller.dof_state[dof_idx]
+        # The component DOFs are contiguous, slice them instead of building
+        # an index array.
+        dof = self.controller.dof_state[start_idx:end_idx]
 
         if isinstance(self.ofc_data.comp_dof_idx[dof_comp]["rot_mat"], float):
             trans_dof = self.ofc_data.comp_dof_idx[dof_comp]["rot_mat"] * dof
         else:
-            inv_rot_mat = np.linalg.pinv(
-                self.ofc_data.comp_dof_idx[dof_comp]["rot_mat"]
-            )
+            inv_rot_mat = self._get_inv_rot_mat(dof_comp)
 
-            trans_dof = inv_rot_mat.dot(dof.reshape(-1, 1)).ravel()
+            trans_dof = inv_rot_mat @ dof
 
         correction = Correction(*trans_dof)
 
         if correction.correction_type != CorrectionType.POSITION:
-            bm2f = BendModeToForce(component=dof_comp[:-4], ofc_data=self.ofc_data)
-            correction = Correction(*bm2f.force(trans_dof))
+            component = dof_comp[:-4]
+            if component not in self._bmf:
+                self._bmf[component] = BendModeToForce(
+                    component=component, ofc_data=self.ofc_data
+                )
+            correction = Correction(*self._bmf[component].force(trans_dof))
 
         return correction
 
+    def _get_inv_rot_mat(self, dof_comp: str) -> np.ndarray[float]:
+        """Get the pseudo-inverse of the rotation matrix of a component.
+
+        The pseudo-inverse is computed once and reused for as long as the
+        component rotation matrix in `OFCData.comp_dof_idx` is not replaced.
+
+        Parameters
+        ----------
+        dof_comp : `string`
+            Name of the component in the DOF index dictionary. See
+            `OFData.comp_dof_idx`.
+
+        Returns
+        -------
+        `numpy.ndarray`
+            Pseudo-inverse of the component rotation matrix (read-only).
+        """
+        rot_mat = self.ofc_data.comp_dof_idx[dof_comp]["rot_mat"]
+
+        if (
+            dof_comp not in self._inv_rot_mat_cache
+            or self._inv_rot_mat_cache[dof_comp][0] is not rot_mat
+        ):
+            inv_rot_mat = np.linalg.pinv(rot_mat)
+            # The cached array is shared between calls, make sure callers
+            # can not modify it in place.
+            inv_rot_mat.flags.writeable = False
+            self._inv_rot_mat_cache[dof_comp] = (rot_mat, inv_rot_mat)
+
+        return self._inv_rot_mat_cache[dof_comp][1]
+
     def init_lv_dof(self) -> None:
         """Initialize last visit degree of freedom."""
 
@@ -22,8 +22,12 @@
 __all__ = ["OFCData"]
 
 import asyncio
+import fnmatch
 import logging
+import os
+import types
 import typing
+from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
@@ -32,6 +36,105 @@ import yaml
 from ..utils import get_config_dir
 from . import BaseOFCData
 
+# Use the libyaml based loader when available, it is much faster than the
+# pure Python one for the large matrices in the policy files.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+# Maximum number of yaml files kept in `_YAML_CACHE`. This is larger than the
+# number of policy files, so only files read from other locations are ever
+# evicted.
+_YAML_CACHE_SIZE = 64
+
+# Parsed content of the yaml files read so far and their modification time,
+# keyed by the file path, so every file is parsed at most once per process
+# unless it changes on disk. Ordered from least to most recently used.
+_YAML_CACHE: dict[str, tuple[int, typing.Any]] = dict()
+
+
+def _load_yaml(file_path: Path | str, copy: bool = True) -> typing.Any:
+    """Load a yaml file, reusing the parsed content if the file was already
+    read and has not been modified since.
+
+    Parameters
+    ----------
+    file_path : `pathlib.Path` or `string`
+        Path to the yaml file.
+    copy : `bool`, optional
+        Return a copy of the cached content (default: `True`). If `False`,
+        the cached content itself is returned and must not be modified.
+
+    Returns
+    -------
+    `typing.Any`
+        Content of the yaml file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If file does not exist.
+    """
+    file_path = os.path.abspath(file_path)
+    mtime = os.stat(file_path).st_mtime_ns
+
+    # Removing the entry and inserting it again keeps the most recently used
+    # files last, and drops the content read before the file was modified.
+    cached = _YAML_CACHE.pop(file_path, None)
+
+    if cached is None or cached[0] != mtime:
+        with open(file_path, "r") as fp:
+            cached = (mtime, yaml.load(fp, Loader=SafeLoader))
+
+    _YAML_CACHE[file_path] = cached
+
+    while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        del _YAML_CACHE[next(iter(_YAML_CACHE))]
+
+    return deepcopy(cached[1]) if copy else cached[1]
+
+
+def _read_only_mapping(
+    value: typing.Mapping | None, convert: typing.Callable[[typing.Any], typing.Any]
+) -> typing.Mapping | None:
+    """Make a read-only copy of a mapping.
+
+    Parameters
+    ----------
+    value : `typing.Mapping` or `None`
+        Mapping to copy.
+    convert : `typing.Callable`
+        Function used to convert each value to an immutable object.
+
+    Returns
+    -------
+    `types.MappingProxyType` or `None`
+        Read-only copy of the mapping, or `None` if `value` is `None`.
+    """
+    if value is None:
+        return None
+
+    return types.MappingProxyType({key: convert(item) for key, item in value.items()})
+
+
+def _read_only_array(value: typing.Any) -> np.ndarray:
+    """Convert a value to a read-only array of floats.
+
+    Parameters
+    ----------
+    value : `typing.Any`
+        Value to convert.
+
+    Returns
+    -------
+    `numpy.ndarray`
+        Read-only array.
+    """
+    array = np.array(value, dtype=float)
+    array.flags.writeable = False
+    return array
+
 
 class OFCData(BaseOFCData):
     """Optical Feedback Control Data.
@@ -59,7 +162,8 @@ class OFCData(BaseOFCData):
     ----------
     bend_mode : `dict`
         Dictionary to hold bending mode data. The data is read alongside the
-        other files when the name is set.
+        other files when the name is set. The actuator influence matrices
+        (``bend_mode[comp]["force"]["data"]``) are stored as `numpy.ndarray`.
     bending_mode_stresses : `dict`
         Mirror bending mode stresses.
     config_dir : `pathlib.Path`
@@ -70,8 +174,12 @@ class OFCData(BaseOFCData):
         Index of Degree of Freedom (DOF).
     field_idx : `dict` of `string`
         Mapping between sensor name and field index.
-    gq_points: `np.ndarray` of `float`
-        Gaussian Quadrature points for LSST field.
+    gq_points : `typing.Mapping` or `None`
+        Gaussian Quadrature points for LSST field (read-only).
+    gq_weights : `typing.Mapping` or `None`
+        Image quality weights of the Gaussian Quadrature points (read-only).
+    gq_y2_correction : `typing.Mapping` or `None`
+        y2 correction at the Gaussian Quadrature points (read-only).
     image_quality_weight : `np.ndarray` of `float`
         Image quality weight for the Gaussian Quadrature points.
     intrinsic_zk : `dict` of `string`
@@ -134,7 +242,7 @@ class OFCData(BaseOFCData):
 
         # Dictionary to hold bending mode data. The data is read alongside the
         # other files when the name is set.
-        self.bend_mode = {
+        self.bend_mode: dict[str, dict[str, dict[str, typing.Any]]] = {
             "M1M3": {
                 "force": {"filename": "M1M3_1um_156_force.yaml"},
                 "rot": {"filename": "rotMatM1M3.yaml"},
@@ -171,11 +279,17 @@ class OFCData(BaseOFCData):
         # Initialize controller configuration
         self._controller_filename = "oic_controller.yaml"
 
-        # Zernike indices used
-        self._zn_idx = np.arange(self.znmax - self.znmin + 1, dtype=int)
+        # Zernike indices used, stored with the native indexing type so they
+        # can be used for fancy indexing without conversion
+        self._zn_idx = np.arange(self.znmax - self.znmin + 1, dtype=np.intp)
         self._zn_idx_mask = np.ones_like(self._zn_idx, dtype=bool)
         self._zn_selected = np.arange(self.znmin, self.znmax + 1, dtype=int)
 
+        # Gaussian quadrature data, only available for lsst
+        self._gq_points: typing.Mapping | None = None
+        self._gq_weights: typing.Mapping | None = None
+        self._gq_y2_correction: typing.Mapping | None = None
+
         # Set the name of the instrument. This reads the instrument-related
         # configuration files.
         if name is not None:
@@ -193,6 +307,9 @@ class OFCData(BaseOFCData):
                 [0.0, 0.0, 0.0, 0.0, -3600.0, 0.0],
             ]
         )
+        # The same matrix is shared by both hexapods and its pseudo-inverse is
+        # cached by OFC, so do not allow it to be modified in place.
+        rot_mat_hexapod.flags.writeable = False
 
         # Index of Degree of Freedom (DOF)
         self._comp_dof_idx = dict(
@@ -214,11 +331,11 @@ class OFCData(BaseOFCData):
             M2Bend=dict(startIdx=30, idxLength=20, state0name="M2Bending", rot_mat=1.0),
         )
 
-        # Index of degree of freedom
-        self._dof_idx = np.arange(
-            sum([self.comp_dof_idx[comp]["idxLength"] for comp in self.comp_dof_idx])
+        # Mask of the degrees of freedom used, see `dof_idx`
+        self._dof_idx_mask = np.ones(
+            sum([self.comp_dof_idx[comp]["idxLength"] for comp in self.comp_dof_idx]),
+            dtype=bool,
         )
-        self._dof_idx_mask = np.ones_like(self._dof_idx, dtype=bool)
 
     @property
     def name(self) -> str | None:
@@ -294,11 +411,66 @@ class OFCData(BaseOFCData):
         """Available reference point strategies."""
         return {"x00", "x0", "0"}
 
+    # Properties to access the Gaussian quadrature data. They are stored as
+    # read-only mappings, so they can only change by being set again and
+    # values derived from them can be cached safely.
+    @property
+    def gq_points(self) -> typing.Mapping | None:
+        """Gaussian quadrature points, as (field_x, field_y) tuples in
+        degrees.
+        """
+        return self._gq_points
+
+    @gq_points.setter
+    def gq_points(self, value: typing.Mapping | None) -> None:
+        """Set the Gaussian quadrature points.
+
+        Parameters
+        ----------
+        value : `typing.Mapping` or `None`
+            Field angles (field_x, field_y) in degrees of each point.
+        """
+        self._gq_points = _read_only_mapping(value, tuple)
+
+    @property
+    def gq_weights(self) -> typing.Mapping | None:
+        """Image quality weights of the Gaussian quadrature points."""
+        return self._gq_weights
+
+    @gq_weights.setter
+    def gq_weights(self, value: typing.Mapping | None) -> None:
+        """Set the image quality weights of the Gaussian quadrature points.
+
+        Parameters
+        ----------
+        value : `typing.Mapping` or `None`
+            Image quality weight of each point.
+        """
+        self._gq_weights = _read_only_mapping(value, float)
+
+    @property
+    def gq_y2_correction(self) -> typing.Mapping | None:
+        """y2 correction at the Gaussian quadrature points."""
+        return self._gq_y2_correction
+
+    @gq_y2_correction.setter
+    def gq_y2_correction(self, value: typing.Mapping | None) -> None:
+        """Set the y2 correction at the Gaussian quadrature points.
+
+        Parameters
+        ----------
+        value : `typing.Mapping` or `None`
+            y2 correction of each point.
+        """
+        self._gq_y2_correction = _read_only_mapping(value, _read_only_array)
+
     # Properties to access the Zernike indices
     @property
     def zn_idx(self) -> np.ndarray[int]:
         """Zernike indices used."""
-        return self._zn_idx[self.zn_idx_mask]
+        # The full zernike index is a contiguous range starting at zero, so
+        # the selected indices are the positions of the non-zero mask entries.
+        return np.flatnonzero(self.zn_idx_mask)
 
     @property
     def zn_idx_mask(self) -> np.ndarray[bool]:
@@ -337,7 +509,9 @@ class OFCData(BaseOFCData):
     @property
     def dof_idx(self) -> np.ndarray[int]:
         """Index of Degree of Freedom (DOF)."""
-        return self._dof_idx[self.dof_idx_mask]
+        # The full DOF index is a contiguous range starting at zero, so the
+        # selected indices are the positions of the non-zero mask entries.
+        return np.flatnonzero(self.dof_idx_mask)
 
     @property
     def dof_idx_mask(self) -> np.ndarray[bool]:
@@ -411,13 +585,21 @@ class OFCData(BaseOFCData):
         self._controller_filename = value
         self.configure_controller()
 
-    def load_yaml_file(self, file_path: Path | str) -> dict:
+    def load_yaml_file(self, file_path: Path | str, copy: bool = True) -> dict:
         """Load yaml file.
 
+        Files are parsed only once per process, as long as they are not
+        modified on disk; later calls return a copy of the parsed content.
+
         Parameters
         ----------
         file_path : `pathlib.Path` or `string`
             Path to the yaml file.
+        copy : `bool`, optional
+            Return a copy of the parsed content (default: `True`). Use
+            `False` to skip the copy when the content is only read, for
+            instance to convert it to an array. It must then not be
+            modified.
 
         Returns
         -------
@@ -431,8 +613,7 @@ class OFCData(BaseOFCData):
         """
 
         try:
-            with open(file_path, "r") as fp:
-                return yaml.safe_load(fp)
+            return _load_yaml(file_path, copy)
         except FileNotFoundError:
             raise RuntimeError(
                 f"Could not read file from policy path: {file_path!s}. "
@@ -511,8 +692,14 @@ class OFCData(BaseOFCData):
                     path = (
                         self.config_dir / comp / self.bend_mode[comp][ftype]["filename"]
                     )
-                    with open(path) as fp:
-                        self.bend_mode[comp][ftype]["data"] = yaml.safe_load(fp)
+                    # Keep the actuator influence matrices as arrays, so that
+                    # every BendModeToForce built from this instance shares
+                    # them instead of converting the nested lists again.
+                    self.bend_mode[comp][ftype]["data"] = (
+                        np.array(self.load_yaml_file(path, copy=False))
+                        if ftype == "force"
+                        else self.load_yaml_file(path)
+                    )
 
         self.log.debug(f"Configuring {instrument}")
 
@@ -528,7 +715,7 @@ class OFCData(BaseOFCData):
         # Read alpha values
         # -----------------
         alpha_path = self.config_dir / "alpha_values.yaml"
-        alpha = np.array(self.load_yaml_file(alpha_path))
+        alpha = np.array(self.load_yaml_file(alpha_path, copy=False))
 
         # Read dof_state0
         # ---------------
@@ -555,7 +742,7 @@ class OFCData(BaseOFCData):
                 / f"{instrument}_gaussian_quadrature_points.yaml"
             )
 
-            gq_points = self.load_yaml_file(gq_points_path)
+            gq_points = self.load_yaml_file(gq_points_path, copy=False)
 
         # Read image quality weights
         # --------------------------
@@ -578,7 +765,7 @@ class OFCData(BaseOFCData):
                 / f"{instrument}_gaussian_quadrature_weights.yaml"
             )
 
-            gq_weights = self.load_yaml_file(gq_weights_path)
+            gq_weights = self.load_yaml_file(gq_weights_path, copy=False)
 
         # Read y2 file
         # -------------
@@ -600,7 +787,7 @@ class OFCData(BaseOFCData):
 
             self.log.debug(f"Configuring y2: {gq_y2_path}")
 
-            gq_y2_correction = self.load_yaml_file(gq_y2_path)
+            gq_y2_correction = self.load_yaml_file(gq_y2_path, copy=False)
 
         # Read all intrinsic zernike coefficients data
         # --------------------------------------------
@@ -617,14 +804,26 @@ class OFCData(BaseOFCData):
                 "exists in the intrinsic zernikes directory"
             )
 
+        # List the intrinsic zernike files only once and match each filter
+        # against the listing, instead of walking the directory per filter.
+        intrinsic_files = list(
+            Path(intrinsic_zk_path).rglob(f"{self.intrinsic_zk_filename_root}_*.yaml")
+        )
+
         for filter_name in self.eff_wavelength.keys():
             file_name = (
                 f"{self.intrinsic_zk_filename_root}_{filter_name.lower()}_31*.yaml"
             )
 
-            intrinsic_file = next(Path(intrinsic_zk_path).rglob(file_name))
+            intrinsic_file = next(
+                path
+                for path in intrinsic_files
+                if fnmatch.fnmatchcase(path.name, file_name)
+            )
 
-            intrinsic_zk[filter_name] = np.array(self.load_yaml_file(intrinsic_file))
+            intrinsic_zk[filter_name] = np.array(
+                self.load_yaml_file(intrinsic_file, copy=False)
+            )
 
         # Read double zernikes sensitivity matrix
         # ---------------------------------------
@@ -636,7 +835,12 @@ class OFCData(BaseOFCData):
             Path(f"{self.config_dir}/sensitivity_matrix").rglob(file_name)
         )
 
-        sensitivity_matrix = np.array(self.load_yaml_file(sensitivity_matrix_path))
+        sensitivity_matrix = np.array(
+            self.load_yaml_file(sensitivity_matrix_path, copy=False)
+        )
+        # SensitivityMatrix reuses its last evaluation for as long as this
+        # array is not replaced, so do not allow it to be modified in place.
+        sensitivity_matrix.flags.writeable = False
 
         # Read configuration file for camera_type
         # ---------------------------------------
@@ -656,7 +860,9 @@ class OFCData(BaseOFCData):
             / self.controller["normalization_weights_filename"]
         )
 
-        normalization_weights = np.array(self.load_yaml_file(configuration_path))
+        normalization_weights = np.array(
+            self.load_yaml_file(configuration_path, copy=False)
+        )
 
         # Now all data was read successfully, time to set it up.
         # ------------------------------------------------------
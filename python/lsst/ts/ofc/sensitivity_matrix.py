@@ -21,6 +21,8 @@
 
 __all__ = ["SensitivityMatrix"]
 
+import math
+
 import galsim
 import numpy as np
 
@@ -34,11 +36,24 @@ class SensitivityMatrix:
     ----------
     ofc_data : `lsst.ts.ofc.ofc_data.OFCData`
         OFC data.
+
+    Notes
+    -----
+    The result of the last call to `evaluate` is kept and returned again
+    when the method is called with the same field angles and rotation angle,
+    as happens at every iteration of a closed loop at a fixed rotator angle,
+    and the configuration it depends on is unchanged.
     """
 
     def __init__(self, ofc_data: OFCData) -> None:
         self.ofc_data = ofc_data
 
+        # Arguments and configuration, double zernike matrix and result of
+        # the last evaluation.
+        self._last_key: tuple | None = None
+        self._last_sensitivity_matrix: np.ndarray | None = None
+        self._last_result: np.ndarray | None = None
+
     def evaluate(
         self,
         field_angles: list,
@@ -58,38 +73,60 @@ class SensitivityMatrix:
         -------
         rotated_sensitivity_matrix : numpy.ndarray [float]
             Sensitivity matrix for the given rotation angle in degree.
+            The array is read-only, since calls with the same arguments may
+            return the same array.
         """
 
+        # Rubin annuli
+        radius_outer = self.ofc_data.config["field"]["radius_outer"]
+        radius_inner = self.ofc_data.config["field"]["radius_inner"]
+
+        key = (
+            tuple(tuple(field_angle) for field_angle in field_angles),
+            rotation_angle,
+            self.ofc_data.znmin,
+            self.ofc_data.znmax,
+            radius_outer,
+            radius_inner,
+        )
+
+        if (
+            self._last_result is not None
+            and key == self._last_key
+            and self._last_sensitivity_matrix is self.ofc_data.sensitivity_matrix
+        ):
+            return self._last_result
+
         # Get the field angles
         field_x, field_y = zip(*field_angles)
 
         # Convert rotation angle to radians
-        rotation_angle = np.deg2rad(rotation_angle)
-
-        # If using double zernikes, compute the sensitivity matrix
-        # using galsim DoubleZernikes
-        rotated_sensitivity_matrix = np.array(
-            [
-                np.array(
-                    [
-                        zk.coef
-                        for zk in galsim.zernike.DoubleZernike(
-                            self.ofc_data.sensitivity_matrix[..., dof_idx],
-                            # Rubin annuli
-                            uv_inner=self.ofc_data.config["field"]["radius_inner"],
-                            uv_outer=self.ofc_data.config["field"]["radius_outer"],
-                            xy_inner=self.ofc_data.config["pupil"]["radius_inner"],
-                            xy_outer=self.ofc_data.config["pupil"]["radius_outer"],
-                        ).rotate(theta_uv=rotation_angle)(field_x, field_y)
-                    ]
-                )
-                for dof_idx in np.arange(self.ofc_data.sensitivity_matrix.shape[2])
-            ]
+        rotation_angle = math.radians(rotation_angle)
+
+        # The double zernike sensitivity matrix has dimensions
+        # (#field_zernikes, #pupil_zernikes, #dofs). Evaluating it at the
+        # field angles is linear in the field zernike coefficients, so
+        # rotate the field coefficients of every dof at once and evaluate
+        # the field zernike basis a single time, instead of building and
+        # evaluating one galsim.zernike.DoubleZernike per dof.
+        kmax = self.ofc_data.sensitivity_matrix.shape[0] - 1
+
+        rotation_matrix = galsim.zernike.zernikeRotMatrix(kmax, rotation_angle)
+        field_basis = galsim.zernike.zernikeBasis(
+            kmax,
+            np.array(field_x),
+            np.array(field_y),
+            R_outer=radius_outer,
+            R_inner=radius_inner,
         )
 
-        # Reshape the sensitivity matrix to be
+        # Sensitivity matrix with dimensions
         # (#field_points, #zernikes, #dofs)
-        rotated_sensitivity_matrix = np.einsum("ijk->jki", rotated_sensitivity_matrix)
+        rotated_sensitivity_matrix = np.tensordot(
+            rotation_matrix.T @ field_basis,
+            self.ofc_data.sensitivity_matrix,
+            axes=(0, 0),
+        )
 
         # Subselect the relevant zernike coefficients
         # to include in the sensitivity matrix.
@@ -97,4 +134,11 @@ class SensitivityMatrix:
             :, self.ofc_data.znmin : self.ofc_data.znmax + 1, :
         ]
 
+        # The result is shared between calls, protect it from modifications.
+        rotated_sensitivity_matrix.flags.writeable = False
+
+        self._last_key = key
+        self._last_sensitivity_matrix = self.ofc_data.sensitivity_matrix
+        self._last_result = rotated_sensitivity_matrix
+
         return rotated_sensitivity_matrix
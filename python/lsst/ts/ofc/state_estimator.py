@@ -22,6 +22,7 @@
 __all__ = ["StateEstimator"]
 
 import logging
+import math
 
 import galsim
 import numpy as np
@@ -80,7 +81,7 @@ class StateEstimator:
     ) -> np.ndarray[float]:
         """Compute the state in the basis of degrees of freedom.
 
-        Solve y = A*x by x = pinv(A)*y.
+        Solve y = A*x in the least-squares sense, x = pinv(A)*y.
 
         Parameters
         ----------
@@ -110,21 +111,21 @@ class StateEstimator:
             field_angles, -rotation_angle
         )
 
-        # Select sensitivity matrix only at used degrees of freedom
-        sensitivity_matrix = sensitivity_matrix[:, self.ofc_data.zn_idx, :]
+        # Select sensitivity matrix only at used zernikes and degrees of
+        # freedom, with a single gather over both axes.
+        sensitivity_matrix = sensitivity_matrix[
+            :, self.ofc_data.zn_idx[:, np.newaxis], self.ofc_data.dof_idx
+        ]
 
         # Reshape sensitivity matrix to dimensions
         # (#zk * #sensors, # dofs) = (19 * #sensors, 50)
         size = sensitivity_matrix.shape[2]
         sensitivity_matrix = sensitivity_matrix.reshape((-1, size))
 
-        # Select sensitivity matrix only at used degrees of freedom
-        sensitivity_matrix = sensitivity_matrix[..., self.ofc_data.dof_idx]
-
-        normalization_matrix = np.diag(
-            self.normalization_weights[self.ofc_data.dof_idx]
-        )
-        sensitivity_matrix = sensitivity_matrix @ normalization_matrix
+        # The normalization matrix is diagonal, so scale the columns of the
+        # sensitivity matrix directly instead of building the dense matrix.
+        normalization_weights = self.normalization_weights[self.ofc_data.dof_idx]
+        sensitivity_matrix = sensitivity_matrix * normalization_weights
 
         # Check the dimension of sensitivity matrix to see if we can invert it
         num_zk, num_dof = sensitivity_matrix.shape
@@ -133,30 +134,21 @@ class StateEstimator:
                 f"Equation number ({num_zk}) < variable number ({num_dof})."
             )
 
-        # Compute the pseudo-inverse of the sensitivity matrix
-        # rcond sets the truncation of different modes.
-        pinv_sensitivity_matrix = np.linalg.pinv(sensitivity_matrix, rcond=self.rcond)
-
         # Rotate the wavefront error to the same orientation as the
-        # sensitivity matrix. When creating galsim.Zernike object,
-        # the coefficients are in units of um which does not matter
-        # here as we are only rotating them.
+        # sensitivity matrix. Rotating a Zernike series is a linear map of
+        # its coefficients (see galsim.zernike.Zernike.rotate), so all the
+        # sensors are rotated with a single rotation matrix product.
         # Note that we need to pad the wfe with zeros for the 4 first
         # Zernike coefficients, since wfe goes from Z4-Z22
-        wfe = np.array(wfe)
-        for idx in range(wfe.shape[0]):
-            wfe_sensor = np.pad(wfe[idx, :], (self.ofc_data.znmin, 0))
-
-            zk_galsim = galsim.zernike.Zernike(
-                wfe_sensor,
-                R_outer=self.ofc_data.config["pupil"]["radius_outer"],
-                R_inner=self.ofc_data.config["pupil"]["radius_inner"],
-            )
-            # Note that we need to remove the first 4 Zernike coefficients
-            # since we padded the wfe with zeros for the 4 first Zernike
-            wfe[idx, :] = zk_galsim.rotate(np.deg2rad(rotation_angle)).coef[
-                self.ofc_data.znmin :
-            ]
+        wfe = np.pad(np.asarray(wfe, dtype=float), ((0, 0), (self.ofc_data.znmin, 0)))
+
+        zk_rotation_matrix = galsim.zernike.zernikeRotMatrix(
+            wfe.shape[1] - 1, math.radians(rotation_angle)
+        )
+
+        # Note that we need to remove the first 4 Zernike coefficients
+        # since we padded the wfe with zeros for the 4 first Zernike
+        wfe = (wfe @ zk_rotation_matrix.T)[:, self.ofc_data.znmin :]
 
         # Compute wavefront error deviation from the intrinsic wavefront error
         # y = wfe - intrinsic_zk - y2_correction
@@ -173,14 +165,17 @@ class StateEstimator:
             - y2_correction[:, self.ofc_data.zn_idx]
         )
 
-        # Reshape wavefront error to dimensions
-        # (#zk * #sensors, 1) = (19 * #sensors, 1)
-        y = y.reshape(-1, 1)
+        # Flatten wavefront error to dimensions
+        # (#zk * #sensors,) = (19 * #sensors,)
+        y = y.ravel()
 
         # Compute optical state estimate in the basis of DOF
         # Because of normalization, we need to de-normalize the result
         # to retrieve the actual DOF values in the original 50 dimensional
         # basis. For more details, see equation (10) in arXiv:2406.04656.
-        x = normalization_matrix @ pinv_sensitivity_matrix.dot(y)
+        # The least-squares solution is equivalent to applying the
+        # pseudo-inverse of the sensitivity matrix, without forming it.
+        # rcond sets the truncation of different modes.
+        x, *_ = np.linalg.lstsq(sensitivity_matrix, y, rcond=self.rcond)
 
-        return x.ravel()
+        return normalization_weights * x
@@ -21,6 +21,8 @@
 
 __all__ = ["get_intrinsic_zernikes", "get_sensor_names"]
 
+import math
+
 import galsim
 import numpy as np
 
@@ -60,7 +62,7 @@ def get_intrinsic_zernikes(
     field_x, field_y = zip(*field_angles)
 
     # Convert rotation angle to radians
-    rotation_angle = np.deg2rad(rotation_angle)
+    rotation_angle = math.radians(rotation_angle)
 
     evaluated_zernikes = np.array(
         [
@@ -97,5 +99,6 @@ def get_sensor_names(ofc_data: OFCData, sensor_ids: np.ndarray[int]) -> list[str
         Sensor names.
     """
     name = "lsst" if ofc_data.name == "lsstfam" else ofc_data.name
+    sensor_id_to_name = ofc_data.sensor_id_to_name[name]
 
-    return [ofc_data.sensor_id_to_name[name][sensor_id] for sensor_id in sensor_ids]
+    return [sensor_id_to_name[sensor_id] for sensor_id in sensor_ids]
@@ -93,6 +93,54 @@ class TestBendModeToForce(unittest.TestCase):
         delta = np.sum(np.abs(bm - dof))
         self.assertLess(delta, 1e-10)
 
+    def test_force_batch(self) -> None:
+        """Test the force and bending mode calculation for a batch of DOFs."""
+        dof = np.zeros((3, 20))
+        dof[0, 0:3] = np.array([1, 2, 3])
+        dof[1, 5] = -1.0
+        dof[2] = np.linspace(-1.0, 1.0, 20)
+
+        force = self.bmf_m1m3.force(dof)
+
+        self.assertEqual(force.shape, (3, 156))
+        for idx in range(len(dof)):
+            np.testing.assert_allclose(force[idx], self.bmf_m1m3.force(dof[idx]))
+
+        np.testing.assert_allclose(self.bmf_m1m3.bending_mode(force), dof, atol=1e-10)
+
+    def test_single_precision(self) -> None:
+        """Test the force and bending mode calculation in single precision."""
+        bmf_m1m3_sp = BendModeToForce(
+            component="M1M3", ofc_data=self.ofc_data, dtype=np.float32
+        )
+
+        dof = np.zeros(20)
+        dof[0:3] = np.array([1, 2, 3])
+        force = bmf_m1m3_sp.force(dof)
+
+        self.assertEqual(bmf_m1m3_sp.rot_mat.dtype, np.float32)
+        self.assertEqual(force.dtype, np.float32)
+        np.testing.assert_allclose(force, self.bmf_m1m3.force(dof), rtol=1e-5)
+        np.testing.assert_allclose(bmf_m1m3_sp.bending_mode(force), dof, atol=1e-4)
+
+    def test_set_rot_mat(self) -> None:
+        """Test that setting the influence matrix updates the bending mode
+        calculation.
+        """
+        dof = np.zeros(20)
+        dof[0:3] = np.array([1, 2, 3])
+        force = self.bmf_m1m3.force(dof)
+
+        self.bmf_m1m3.rot_mat = 2.0 * self.bmf_m1m3.rot_mat
+
+        bm = self.bmf_m1m3.bending_mode(force)
+
+        np.testing.assert_allclose(bm, dof / 2.0, atol=1e-10)
+
+        # The influence matrix can only be changed through the setter
+        with self.assertRaises(ValueError):
+            self.bmf_m1m3.rot_mat[0, 0] = 1.0
+
     def test_bad_init(self) -> None:
         """Test the class initialization with a bad component name."""
         with self.assertRaises(RuntimeError):
@@ -292,6 +292,23 @@ class TestOFC(unittest.TestCase):
         self.assertAlmostEqual(correction[4], 2 * correction0[4])
         self.assertAlmostEqual(correction[5], 2 * correction0[5])
 
+    def test_get_correction_rot_mat_change(self) -> None:
+        """Test that the correction follows a change of the component
+        rotation matrix.
+        """
+        correction = self._calculate_cam_hex_correction()
+
+        np.testing.assert_array_equal(
+            self.ofc.get_correction("camHexPos").correction, correction
+        )
+
+        comp_dof_idx = self.ofc_data.comp_dof_idx["camHexPos"]
+        comp_dof_idx["rot_mat"] = 2.0 * comp_dof_idx["rot_mat"]
+
+        np.testing.assert_allclose(
+            self.ofc.get_correction("camHexPos").correction, 0.5 * correction
+        )
+
     def _calculate_cam_hex_correction(self) -> np.ndarray:
         """Calculate the camera hexapod correction."""
         filter_name = "R"
@@ -19,7 +19,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+import tempfile
 import unittest
+from pathlib import Path
 
 import numpy as np
 from lsst.ts.ofc import OFCData
@@ -64,9 +67,64 @@ class TestOFCData(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.ofc_data.xref = "bad_xref"
 
+    def test_load_yaml_file(self) -> None:
+        """Test that load_yaml_file returns independent copies and reloads
+        files modified on disk.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "test.yaml"
+            file_path.write_text("a: [1, 2]\n")
+
+            content = self.ofc_data.load_yaml_file(file_path)
+            self.assertEqual(content, dict(a=[1, 2]))
+
+            # Modifying the returned content must not change the next read
+            content["a"].append(3)
+            self.assertEqual(self.ofc_data.load_yaml_file(file_path), dict(a=[1, 2]))
+
+            # Files modified on disk are read again
+            file_path.write_text("a: [3]\n")
+            stat = file_path.stat()
+            os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            self.assertEqual(self.ofc_data.load_yaml_file(file_path), dict(a=[3]))
+
+            self.assertEqual(
+                self.ofc_data.load_yaml_file(file_path, copy=False), dict(a=[3])
+            )
+
+            with self.assertRaises(RuntimeError):
+                self.ofc_data.load_yaml_file(Path(tmp_dir) / "missing.yaml")
+
+    def test_gq_data_is_read_only(self) -> None:
+        """Test that the Gaussian quadrature data can only be changed by
+        setting it again.
+        """
+        with self.assertRaises(TypeError):
+            self.ofc_data.gq_weights[0] = 1.0
+        with self.assertRaises(TypeError):
+            self.ofc_data.gq_points[0] = (0.0, 0.0)
+        with self.assertRaises(ValueError):
+            self.ofc_data.gq_y2_correction[0][0] = 1.0
+
+        y2_correction = {
+            idx: np.zeros_like(value)
+            for idx, value in self.ofc_data.gq_y2_correction.items()
+        }
+        self.ofc_data.gq_y2_correction = y2_correction
+        y2_correction[0] = np.ones_like(y2_correction[0])
+
+        np.testing.assert_array_equal(self.ofc_data.gq_y2_correction[0], 0.0)
+        self.assertFalse(self.ofc_data.gq_y2_correction[0].flags.writeable)
+
+    def test_sensitivity_matrix_is_read_only(self) -> None:
+        """Test that the sensitivity matrix can not be modified in place."""
+        with self.assertRaises(ValueError):
+            self.ofc_data.sensitivity_matrix[0, 0, 0] = 1.0
+
     def test_dof_idx(self) -> None:
         """Test the dof_idx property."""
         self.assertTrue(isinstance(self.ofc_data.dof_idx, np.ndarray))
+        self.assertEqual(self.ofc_data.dof_idx.dtype, np.intp)
         self.assertEqual(len(self.ofc_data.dof_idx), 50)
 
         with self.assertRaises(AttributeError):
@@ -89,6 +147,7 @@ class TestOFCData(unittest.TestCase):
         new_zn_selected = np.array([4, 5, 10, 20, 25])
         self.ofc_data.zn_selected = new_zn_selected
         self.assertEqual(len(self.ofc_data.zn_idx), 5)
+        self.assertEqual(self.ofc_data.zn_idx.dtype, np.intp)
         np.testing.assert_array_equal(
             self.ofc_data.zn_idx, new_zn_selected - self.ofc_data.znmin
         )
@@ -123,6 +182,7 @@ class TestOFCData(unittest.TestCase):
         self.ofc_data.comp_dof_idx = new_dof_mask
 
         self.assertEqual(len(self.ofc_data.dof_idx), 5)
+        np.testing.assert_array_equal(self.ofc_data.dof_idx, np.arange(5, 10))
 
         with self.assertRaises(ValueError):
             self.ofc_data.comp_dof_idx = np.zeros_like(self.ofc_data.dof_idx)
@@ -127,6 +127,161 @@ class TestOICController(unittest.TestCase):
 
         assert self.mean_squared_residual(uk_ref0, uk) < 1e-6
 
+    def test_calc_uk_dense_h_matrix(self) -> None:
+        """Test that passing the dense H matrix instead of its diagonal
+        fails.
+        """
+        n_dof = len(self.ofc_data.dof_idx)
+        mat_f = np.eye(n_dof)
+        qx = np.ones(n_dof)
+
+        for calc_uk in (self.controller.calc_uk_x00, self.controller.calc_uk_0):
+            with self.subTest(calc_uk=calc_uk.__name__):
+                self.assertEqual(
+                    calc_uk(mat_f=mat_f, qx=qx, h_diag=np.ones(n_dof)).shape,
+                    (n_dof,),
+                )
+                with self.assertRaises(ValueError):
+                    calc_uk(mat_f=mat_f, qx=qx, h_diag=np.eye(n_dof))
+
+    def test_uk_selection_change(self) -> None:
+        """Test that uk and the control step follow a change of the used
+        zernikes and degrees of freedom.
+        """
+        self.ofc_data.xref = "x0"
+        dof_state = self.controller.dof_state0
+        self.controller.uk(self.filter_name, dof_state)
+
+        # Controller that only computes uk after the selection changed
+        controller = OICController(self.ofc_data)
+        controller.dof_state0 = self.controller.dof_state0
+        controller.reset_dof_state()
+
+        self.ofc_data.zn_selected = np.arange(4, 16)
+        self.ofc_data.comp_dof_idx = dict(
+            m2HexPos=np.ones(5, dtype=bool),
+            camHexPos=np.ones(5, dtype=bool),
+            M1M3Bend=np.zeros(20, dtype=bool),
+            M2Bend=np.ones(20, dtype=bool),
+        )
+        self.controller.reset_history()
+        controller.reset_history()
+
+        dof_state = dof_state[self.ofc_data.dof_idx]
+        uk = self.controller.uk(self.filter_name, dof_state)
+        control_effort = self.controller.control_step(self.filter_name, dof_state)
+
+        self.assertEqual(len(uk), len(self.ofc_data.dof_idx))
+        np.testing.assert_allclose(uk, controller.uk(self.filter_name, dof_state))
+        np.testing.assert_allclose(
+            control_effort, controller.control_step(self.filter_name, dof_state)
+        )
+
+    def test_uk_gq_y2_correction_change(self) -> None:
+        """Test that uk follows a change of the Gaussian quadrature y2
+        correction.
+        """
+        self.ofc_data.xref = "x0"
+        dof_state = self.controller.dof_state0
+        uk = self.controller.uk(self.filter_name, dof_state)
+
+        # Controller that only computes uk after the y2 correction changed
+        controller = OICController(self.ofc_data)
+
+        # The y2 correction can not be changed in place, which would go
+        # unnoticed by uk
+        with self.assertRaises(ValueError):
+            self.ofc_data.gq_y2_correction[0] += 0.1
+        with self.assertRaises(TypeError):
+            self.ofc_data.gq_y2_correction[0] = self.ofc_data.gq_y2_correction[0] + 0.1
+        np.testing.assert_array_equal(
+            self.controller.uk(self.filter_name, dof_state), uk
+        )
+
+        self.ofc_data.gq_y2_correction = {
+            idx: np.asarray(value) + 0.1
+            for idx, value in self.ofc_data.gq_y2_correction.items()
+        }
+
+        new_uk = self.controller.uk(self.filter_name, dof_state)
+
+        self.assertFalse(np.allclose(new_uk, uk))
+        np.testing.assert_allclose(new_uk, controller.uk(self.filter_name, dof_state))
+
+    def test_uk_dense_reference(self) -> None:
+        """Test uk against a dense solve of the control law, before and after
+        a change of the motion penalty.
+        """
+        self.ofc_data.xref = "x0"
+        dof_state = self.controller.dof_state0
+        zn_idx = self.ofc_data.zn_idx
+        dof_idx = self.ofc_data.dof_idx
+
+        n_points = len(self.ofc_data.gq_weights)
+        field_angles = [self.ofc_data.gq_points[idx] for idx in range(n_points)]
+        weights = np.array([self.ofc_data.gq_weights[idx] for idx in range(n_points)])
+        weights /= weights.sum()
+        y2c = np.array(
+            [self.ofc_data.gq_y2_correction[idx] for idx in range(n_points)]
+        )[:, zn_idx]
+
+        sensitivity_matrix = self.controller.dz_sensitivity_matrix.evaluate(
+            field_angles
+        )[:, zn_idx][..., dof_idx]
+        cc_mat = np.diag(self.ofc_data.alpha[zn_idx])
+        mat_h = np.diag(self.controller.authority()[dof_idx] ** 2)
+
+        q_mat = sum(
+            weight * mat_a.T @ cc_mat @ mat_a
+            for weight, mat_a in zip(weights, sensitivity_matrix)
+        )
+        qx = sum(
+            weight * mat_a.T @ cc_mat @ (mat_a @ dof_state + y2k)
+            for weight, mat_a, y2k in zip(weights, sensitivity_matrix, y2c)
+        )
+
+        for motion_penalty in (0.1, 0.001, 0.1):
+            with self.subTest(motion_penalty=motion_penalty):
+                self.ofc_data.motion_penalty = motion_penalty
+
+                expected = np.linalg.solve(motion_penalty**2 * mat_h + q_mat, qx)
+
+                np.testing.assert_allclose(
+                    self.controller.uk(self.filter_name, dof_state),
+                    expected,
+                    rtol=1e-6,
+                    atol=1e-6 * np.abs(expected).max(),
+                )
+
+    def test_uk_float32(self) -> None:
+        """Test computing the F matrix in single precision."""
+        # The F matrix is too ill-conditioned for single precision with the
+        # small motion penalty used by the other tests.
+        self.ofc_data.motion_penalty = 0.001
+        dof_state = self.controller.dof_state0
+        controller = OICController(self.ofc_data, dtype=np.float32)
+        uk = controller.uk(self.filter_name, dof_state)
+
+        np.testing.assert_allclose(
+            uk,
+            self.controller.uk(self.filter_name, dof_state),
+            rtol=1e-3,
+            atol=1e-3 * np.abs(uk).max(),
+        )
+
+    def test_authority(self) -> None:
+        """Test that the authority follows changes of the influence
+        matrices.
+        """
+        authority = self.controller.authority()
+        np.testing.assert_array_equal(authority, self.controller.authority())
+
+        self.controller.m1m3_bmf.rot_mat = 2.0 * self.controller.m1m3_bmf.rot_mat
+
+        new_authority = self.controller.authority()
+        np.testing.assert_allclose(new_authority[10:30], 2.0 * authority[10:30])
+        np.testing.assert_array_equal(new_authority[30:], authority[30:])
+
     def test_all_xref_ok(self) -> None:
         """Test all xref methods are available."""
         for xref in self.ofc_data.xref_list:
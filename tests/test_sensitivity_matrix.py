@@ -23,6 +23,7 @@ import unittest
 from glob import glob
 from pathlib import Path
 
+import galsim
 import numpy as np
 import yaml
 from lsst.ts.ofc import OFCData, SensitivityMatrix
@@ -148,6 +149,77 @@ class TestSensitivityMatrix(unittest.TestCase):
                 < 2e-4
             )
 
+    def test_evaluate_reuses_last_result(self) -> None:
+        """Test that repeated evaluations reuse the previous result."""
+        sensitivity_matrix = self.sensitivity_matrix.evaluate(
+            field_angles=self.field_angles
+        )
+
+        self.assertIs(sensitivity_matrix, self.unrotated_sensitivity_matrix)
+        self.assertFalse(sensitivity_matrix.flags.writeable)
+
+        rotated_sensitivity_matrix = self.sensitivity_matrix.evaluate(
+            field_angles=self.field_angles, rotation_angle=45.0
+        )
+
+        self.assertIsNot(rotated_sensitivity_matrix, sensitivity_matrix)
+        self.assertFalse(np.allclose(rotated_sensitivity_matrix, sensitivity_matrix))
+
+    def test_evaluate_field_radius_change(self) -> None:
+        """Test that evaluations follow a change of the field radii."""
+        sensitivity_matrix = self.sensitivity_matrix.evaluate(
+            field_angles=self.field_angles
+        )
+
+        self.ofc_data.config["field"]["radius_outer"] *= 1.2
+        self.ofc_data.config["field"]["radius_inner"] *= 1.2
+
+        new_sensitivity_matrix = self.sensitivity_matrix.evaluate(
+            field_angles=self.field_angles
+        )
+
+        self.assertFalse(np.allclose(new_sensitivity_matrix, sensitivity_matrix))
+        np.testing.assert_allclose(
+            new_sensitivity_matrix,
+            SensitivityMatrix(self.ofc_data).evaluate(field_angles=self.field_angles),
+        )
+
+    def test_evaluate_double_zernike(self) -> None:
+        """Test the sensitivity matrix against a direct evaluation of the
+        double zernike series of each degree of freedom.
+        """
+        field_x, field_y = zip(*self.field_angles)
+        config = self.ofc_data.config
+
+        for angle in [0.0, 33.0]:
+            with self.subTest(angle=angle):
+                expected = np.array(
+                    [
+                        [
+                            zk.coef
+                            for zk in galsim.zernike.DoubleZernike(
+                                self.ofc_data.sensitivity_matrix[..., dof_idx],
+                                uv_inner=config["field"]["radius_inner"],
+                                uv_outer=config["field"]["radius_outer"],
+                                xy_inner=config["pupil"]["radius_inner"],
+                                xy_outer=config["pupil"]["radius_outer"],
+                            ).rotate(theta_uv=np.deg2rad(angle))(field_x, field_y)
+                        ]
+                        for dof_idx in range(self.ofc_data.sensitivity_matrix.shape[2])
+                    ]
+                )
+                expected = np.einsum("ijk->jki", expected)[
+                    :, self.ofc_data.znmin : self.ofc_data.znmax + 1, :
+                ]
+
+                np.testing.assert_allclose(
+                    self.sensitivity_matrix.evaluate(
+                        field_angles=self.field_angles, rotation_angle=angle
+                    ),
+                    expected,
+                    atol=1e-10,
+                )
+
     def test_rotation(self) -> None:
         """Test the rotation of the sensitivity matrix."""
         angles = [20, 60, 45, 90, 180, 270]